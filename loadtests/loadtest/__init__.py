@@ -28,6 +28,9 @@ ACTIONS_FREQUENCIES = [
     ('list_continuated_pagination', 80),
 ]
 
+# Should match the server ``cliquet.batch_max_requests`` setting.
+BATCH_MAX_REQUESTS = 25
+
 
 def build_article():
     suffix = uuid.uuid4().hex
@@ -96,8 +99,9 @@ class TestBasic(TestCase):
         """
         nb_initial_records = self.nb_initial_records
         while nb_initial_records > 0:
-            self.create()
-            nb_initial_records -= 1
+            nb_records = min(nb_initial_records, BATCH_MAX_REQUESTS)
+            self.batch_create(nb_records, expected_status=201)
+            nb_initial_records -= nb_records
 
         resp = self.session.get(self.api_url('articles'), auth=self.auth)
         records = resp.json()['data']
@@ -133,7 +137,7 @@ class TestBasic(TestCase):
         else:
             self.test_all()
 
-    def _run_batch(self, body):
+    def _run_batch(self, body, expected_status=None):
         resp = self.session.post(self.api_url('batch'),
                                  data=json.dumps(body),
                                  auth=self.auth,
@@ -142,6 +146,8 @@ class TestBasic(TestCase):
         self.assertEqual(resp.status_code, 200)
         for subresponse in resp.json()['responses']:
             self.incr_counter(subresponse['status'])
+            if expected_status is not None:
+                self.assertEqual(subresponse['status'], expected_status)
 
     def create(self):
         data = build_article()
@@ -153,18 +159,18 @@ class TestBasic(TestCase):
         self.incr_counter(resp.status_code)
         self.assertEqual(resp.status_code, 201)
 
-    def batch_create(self):
+    def batch_create(self, nb_records=BATCH_MAX_REQUESTS,
+                     expected_status=None):
         data = {
             "defaults": {
                 "method": "POST",
                 "path": "/articles"
-            }
+            },
+            "requests": [{"body": {'data': build_article()}}
+                         for i in range(nb_records)]
         }
-        for i in range(25):
-            request = {"body": {'data': build_article()}}
-            data.setdefault("requests", []).append(request)
 
-        self._run_batch(data)
+        self._run_batch(data, expected_status)
 
     def create_conflict(self):
         data = self.random_record.copy()
@@ -225,7 +231,7 @@ class TestBasic(TestCase):
                 "method": "PATCH",
             }
         }
-        for i in range(25):
+        for i in range(BATCH_MAX_REQUESTS):
             request = {
                 "path": urls[i % len(urls)],
                 "body": {
@@ -287,7 +293,7 @@ class TestBasic(TestCase):
                 "method": "DELETE"
             }
         }
-        for i in range(25):
+        for i in range(BATCH_MAX_REQUESTS):
             request = {"path": urls[i % len(urls)]}
             data.setdefault("requests", []).append(request)
 
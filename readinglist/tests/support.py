@@ -13,11 +13,16 @@ from readinglist import API_VERSION
 class BaseWebTest(CliquetBaseTest):
     """Base Web Test to test your cornice service.
 
-    It setups the database before each test and delete it after.
+    It creates the database schema once per run, and flushes the tables
+    after each test.
     """
+    _schema_initialized = False
+
     def __init__(self, *args, **kwargs):
         super(BaseWebTest, self).__init__(*args, **kwargs)
-        self.storage.initialize_schema()
+        if not BaseWebTest._schema_initialized:
+            self.storage.initialize_schema()
+            BaseWebTest._schema_initialized = True
 
     def _get_test_app(self, settings=None):
         app = webtest.TestApp("config:config/readinglist.ini",
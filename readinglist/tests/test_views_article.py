@@ -22,21 +22,26 @@ class IntegrationTest(BaseWebTest, unittest.TestCase):
             status=200)
 
     def test_default_paginate_by_is_100(self):
-        for i in range(102):
-            data = MINIMALIST_ARTICLE.copy()
-            data['url'] += '-%s' % i
-            self.app.post_json('/articles',
-                               {'data': data},
-                               headers=self.headers)
+        urls = ['%s-%s' % (MINIMALIST_ARTICLE['url'], i) for i in range(102)]
+        requests = [{'body': {'data': dict(MINIMALIST_ARTICLE, url=url)}}
+                    for url in urls]
+        settings = self.app.app.registry.settings
+        max_requests = int(settings['cliquet.batch_max_requests'])
+        for i in range(0, len(requests), max_requests):
+            chunk = requests[i:i + max_requests]
+            batch = {'defaults': {'method': 'POST', 'path': '/articles'},
+                     'requests': chunk}
+            resp = self.app.post_json('/batch', batch, headers=self.headers)
+            statuses = [r['status'] for r in resp.json['responses']]
+            self.assertEqual(statuses, [201] * len(chunk))
         resp = self.app.get('/articles', headers=self.headers)
         self.assertEqual(len(resp.json['data']), 100)
 
 
 class ArticleCreationTest(BaseWebTest, unittest.TestCase):
     def test_stored_on_is_forced_even_if_specified(self):
-        data = MINIMALIST_ARTICLE.copy()
         for value in ('', 123, None):
-            data['stored_on'] = value
+            data = dict(MINIMALIST_ARTICLE, stored_on=value)
             resp = self.app.post_json('/articles',
                                       {'data': data},
                                       headers=self.headers)
@@ -219,9 +224,9 @@ class ConflictingArticleTest(BaseWebTest, unittest.TestCase):
         self.assertEqual(self.before['resolved_url'], self.before['url'])
 
         # Try to create another one, with duplicate resolved_url
-        record = MINIMALIST_ARTICLE.copy()
-        record['resolved_url'] = record['url']
-        record['url'] = 'http://bit.ly/abc'
+        record = dict(MINIMALIST_ARTICLE,
+                      resolved_url=MINIMALIST_ARTICLE['url'],
+                      url='http://bit.ly/abc')
 
         resp = self.app.post_json('/articles',
                                   {'data': record},
@@ -230,8 +235,7 @@ class ConflictingArticleTest(BaseWebTest, unittest.TestCase):
         self.assertDictEqual(self.before, resp.json['data'])
 
     def test_return_409_on_conflict_with_resolved_url(self):
-        record = MINIMALIST_ARTICLE.copy()
-        record['url'] = 'https://ssl.mozilla.org'
+        record = dict(MINIMALIST_ARTICLE, url='https://ssl.mozilla.org')
         resp = self.app.post_json('/articles',
                                   {'data': record},
                                   headers=self.headers)
@@ -293,8 +297,7 @@ class DeletedArticleTest(BaseWebTest, unittest.TestCase):
                            headers=self.headers)
 
         # Create another and archive
-        data = MINIMALIST_ARTICLE.copy()
-        data['url'] = 'http://host.com'
+        data = dict(MINIMALIST_ARTICLE, url='http://host.com')
         resp = self.app.post_json('/articles',
                                   {'data': data},
                                   headers=self.headers)